@@ -2,11 +2,23 @@
 kubexec - Execute commands and scripts on Kubernetes pods with Docker access
 """
 
-__version__ = "0.6.1"
+from ._version import __version__
+
 __author__ = "kubexec team"
 
-from .cli import main
-from .executor import KubeExecutor
-from .config import Config
+__all__ = ["main", "KubeExecutor", "Config"]
+
 
-__all__ = ["main", "KubeExecutor", "Config"]
\ No newline at end of file
+def __getattr__(name):
+    # Resolve public names lazily (PEP 562) so importing the package, e.g.
+    # for the console scripts, does not pull in PyYAML or the kubernetes client
+    if name == "main":
+        from .cli import main
+        return main
+    if name == "KubeExecutor":
+        from .executor import KubeExecutor
+        return KubeExecutor
+    if name == "Config":
+        from .config import Config
+        return Config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,3 @@
+"""Version information for kubexec"""
+
+__version__ = "0.6.1"
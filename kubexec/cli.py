@@ -4,25 +4,35 @@ import argparse
 import logging
 import sys
 import os
-from typing import List, Optional
-from .config import Config
-from .executor import KubeExecutor
-from .k8s_client import KubernetesClient
+from typing import List, Optional, TYPE_CHECKING
 from .exceptions import KubeExecError
 
+# Heavy modules (PyYAML, kubernetes client) are imported lazily so that
+# --help, --version and argument errors stay fast
+if TYPE_CHECKING:
+    from .config import Config
+    from .k8s_client import KubernetesClient
+
+
+logger = logging.getLogger(__name__)
+
+_VERBOSE_FMT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_PLAIN_FMT = '%(message)s'
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Setup logging configuration"""
-    level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s' if verbose else '%(message)s',
+        level=logging.DEBUG if verbose else logging.INFO,
+        format=_VERBOSE_FMT if verbose else _PLAIN_FMT,
         datefmt='%Y-%m-%d %H:%M:%S'
     )
 
 
 def create_parser() -> argparse.ArgumentParser:
     """Create command-line argument parser"""
+    from ._version import __version__
+    
     parser = argparse.ArgumentParser(
         prog='kubexec',
         description='Execute commands or scripts on Kubernetes pods with Docker access',
@@ -136,34 +146,114 @@ Examples:
     parser.add_argument(
         '--version',
         action='version',
-        version=f'%(prog)s {__import__("kubexec").__version__}'
+        version=f'%(prog)s {__version__}'
     )
     
     return parser
 
 
+def create_operation_parser() -> argparse.ArgumentParser:
+    """Create a minimal parser for --list-jobs / --cleanup-old (no TARGET)"""
+    parser = argparse.ArgumentParser(
+        prog='kubexec',
+        description='Manage kubexec jobs'
+    )
+    
+    parser.add_argument(
+        '-n', '--namespace',
+        help='Kubernetes namespace (default: default)'
+    )
+    
+    parser.add_argument(
+        '--context',
+        help='Kubernetes context to use'
+    )
+    
+    parser.add_argument(
+        '--config',
+        help='Configuration file (default: ~/.config/kubexec/config.yaml)'
+    )
+    
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Verbose output'
+    )
+    
+    parser.add_argument(
+        '--list-jobs',
+        action='store_true',
+        help='List recent kubexec jobs'
+    )
+    
+    parser.add_argument(
+        '--cleanup-old',
+        type=int,
+        metavar='HOURS',
+        help='Cleanup jobs older than specified hours'
+    )
+    
+    return parser
+
+
+def _sniff_operation(argv: List[str]) -> Optional[str]:
+    """Detect fast-path invocations before building the full parser"""
+    operation = None
+    for arg in argv:
+        if arg == '--':
+            break
+        if arg in ('-h', '--help'):
+            # Full help needs the full parser
+            return None
+        if arg == '--version':
+            operation = 'version'
+        elif arg == '--list-jobs' or arg.startswith('--cleanup-old'):
+            operation = operation or 'operation'
+    return operation
+
+
 def main() -> int:
     """Main CLI entry point"""
-    parser = create_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    operation = _sniff_operation(argv)
     
-    # Setup logging
-    setup_logging(args.verbose)
-    logger = logging.getLogger(__name__)
+    if operation == 'version':
+        from ._version import __version__
+        print(f"kubexec {__version__}")
+        return 0
+    
+    parser = create_operation_parser() if operation else create_parser()
+    args = parser.parse_args(argv)
+    if args.cleanup_old is not None and args.cleanup_old < 0:
+        parser.error("--cleanup-old HOURS must not be negative")
+    
+    # Setup logging; a plain dry run only prints, and any error still
+    # reaches stderr through logging's last-resort handler
+    if args.verbose or not getattr(args, 'dry_run', False):
+        setup_logging(args.verbose)
+    
+    from .config import Config
+    from .executor import KubeExecutor
+    from .k8s_client import KubernetesClient, enable_orjson
     
     try:
         # Load configuration
         config = Config(args.config)
         
         # Initialize Kubernetes client
+        enable_orjson()
         k8s_client = KubernetesClient(args.context)
         
         # Handle special operations
         if args.list_jobs:
-            return _handle_list_jobs(k8s_client, args.namespace or config.get('namespace'))
+            return _handle_list_jobs(config, k8s_client, args.namespace or config.get('namespace'))
         
-        if args.cleanup_old:
-            return _handle_cleanup_old(k8s_client, args.namespace or config.get('namespace'), args.cleanup_old)
+        if args.cleanup_old is not None:
+            return _handle_cleanup_old(config, k8s_client, args.namespace or config.get('namespace'), args.cleanup_old)
+        
+        if operation:
+            # The operation parser has no TARGET to fall through to
+            parser.error("one of --list-jobs or --cleanup-old is required")
         
         # Validate target
         if not args.target:
@@ -190,7 +280,8 @@ def main() -> int:
             volume_mounts=args.volume_mounts,
             create_pod=args.create_pod,
             cleanup=cleanup,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            stream_output=True
         )
         
         # Print output
@@ -200,24 +291,24 @@ def main() -> int:
         return exit_code
         
     except KubeExecError as e:
-        logger.error(f"kubexec error: {e}")
+        logger.error("kubexec error: %s", e)
         return 1
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
         return 130
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         if args.verbose:
             import traceback
             traceback.print_exc()
         return 1
 
 
-def _handle_list_jobs(k8s_client: KubernetesClient, namespace: str) -> int:
+def _handle_list_jobs(config: 'Config', k8s_client: 'KubernetesClient', namespace: str) -> int:
     """Handle --list-jobs operation"""
     try:
         from .executor import KubeExecutor
-        executor = KubeExecutor(Config(), k8s_client)
+        executor = KubeExecutor(config, k8s_client)
         jobs = executor.list_jobs(namespace)
         
         if not jobs:
@@ -233,22 +324,22 @@ def _handle_list_jobs(k8s_client: KubernetesClient, namespace: str) -> int:
         return 0
         
     except Exception as e:
-        logging.error(f"Failed to list jobs: {e}")
+        logger.error("Failed to list jobs: %s", e)
         return 1
 
 
-def _handle_cleanup_old(k8s_client: KubernetesClient, namespace: str, max_age_hours: int) -> int:
+def _handle_cleanup_old(config: 'Config', k8s_client: 'KubernetesClient', namespace: str, max_age_hours: int) -> int:
     """Handle --cleanup-old operation"""
     try:
         from .executor import KubeExecutor
-        executor = KubeExecutor(Config(), k8s_client)
+        executor = KubeExecutor(config, k8s_client)
         cleaned_count = executor.cleanup_old_jobs(namespace, max_age_hours)
         
         print(f"Cleaned up {cleaned_count} jobs older than {max_age_hours} hours")
         return 0
         
     except Exception as e:
-        logging.error(f"Failed to cleanup old jobs: {e}")
+        logger.error("Failed to cleanup old jobs: %s", e)
         return 1
 
 
@@ -1,24 +1,76 @@
 """Configuration management for kubexec"""
 
 import os
-import yaml
+import copy
+import json
+import functools
+import subprocess
+from dataclasses import dataclass
+from types import MappingProxyType
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from .exceptions import ConfigurationError
 
 
+def _yaml_loader():
+    """Return libyaml's C loader when PyYAML was built against it"""
+    import yaml
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _yaml_dumper():
+    """Return libyaml's C dumper when PyYAML was built against it"""
+    import yaml
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+# Resolved once at import: user and home do not change during a run
+DEFAULT_CONFIG_DIRS = [
+    f"/shared/team/kubexec/{os.getenv('USER', 'default')}/",
+    os.path.join(os.path.expanduser("~"), ".config", "kubexec"),
+    f"/tmp/kubexec"
+]
+
+DEFAULT_CONFIG_FILE = "config.yaml"
+
+
+@functools.lru_cache(maxsize=4)
+def _find_config_file(config_dirs: Tuple[str, ...], config_file: str) -> str:
+    """Find configuration file using fallback strategy (cached per process)"""
+    for config_dir in config_dirs:
+        config_path = os.path.join(config_dir, config_file)
+        if os.path.exists(config_path):
+            return config_path
+    
+    # Return first directory as default location
+    return os.path.join(config_dirs[0], config_file)
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedConfig:
+    """Typed snapshot of the merged configuration; resource specs are unvalidated"""
+    docker_image: str
+    namespace: str
+    memory: str
+    cpu: str
+    workdir: str
+    cleanup: bool
+    timeout: int
+    ttl_seconds_after_finished: int
+    security_context: Optional[Dict[str, Any]]
+    node_selector: Optional[Dict[str, str]]
+    automount_service_account_token: bool
+
+
 class Config:
     """Configuration manager for kubexec"""
     
-    DEFAULT_CONFIG_DIRS = [
-        f"/shared/team/kubexec/{os.getenv('USER', 'default')}/",
-        os.path.join(os.path.expanduser("~"), ".config", "kubexec"),
-        f"/tmp/kubexec"
-    ]
+    DEFAULT_CONFIG_DIRS = DEFAULT_CONFIG_DIRS
     
-    DEFAULT_CONFIG_FILE = "config.yaml"
+    DEFAULT_CONFIG_FILE = DEFAULT_CONFIG_FILE
     
-    DEFAULT_CONFIG = {
+    # Read-only at the top level; _load_config deep-copies the nested values
+    DEFAULT_CONFIG = MappingProxyType({
         'docker_image': 'ubuntu:latest',
         'namespace': None,  # Will be auto-detected from service account
         'memory': '1Gi',
@@ -38,39 +90,85 @@ class Config:
             'hub.jupyter.org/node-purpose': 'user'
         },
         'automount_service_account_token': False
+    })
+    
+    _ENV_MAPPINGS = {
+        'KUBEXEC_DOCKER_IMAGE': 'docker_image',
+        'KUBEXEC_NAMESPACE': 'namespace',
+        'KUBEXEC_MEMORY': 'memory',
+        'KUBEXEC_CPU': 'cpu',
+        'KUBEXEC_WORKDIR': 'workdir',
+        'KUBEXEC_CLEANUP': 'cleanup',
+        'KUBEXEC_VERBOSE': 'verbose',
+        'KUBEXEC_TIMEOUT': 'timeout',
     }
     
+    _BOOL_KEYS = frozenset(('cleanup', 'verbose'))
+    
+    # Detected namespace, shared by all instances
+    _cached_namespace: Optional[str] = None
+    
     def __init__(self, config_file: Optional[str] = None):
         self.config_file = config_file or self._find_config_file()
-        # Detect namespace before loading config so it can be used as default
-        self._detected_namespace = self._detect_namespace()
-        self.config = self._load_config()
+    
+    @functools.cached_property
+    def config(self) -> Dict[str, Any]:
+        """Merged configuration, loaded on first access"""
+        return self._load_config()
+    
+    @functools.cached_property
+    def resolved(self) -> ResolvedConfig:
+        """Merged configuration as attributes"""
+        config = self.config
+        return ResolvedConfig(
+            docker_image=config.get('docker_image'),
+            namespace=config.get('namespace'),
+            memory=config.get('memory'),
+            cpu=config.get('cpu'),
+            workdir=config.get('workdir'),
+            cleanup=config.get('cleanup'),
+            timeout=config.get('timeout', 3600),
+            ttl_seconds_after_finished=config.get('ttl_seconds_after_finished', 60),
+            security_context=config.get('security_context'),
+            node_selector=config.get('node_selector'),
+            automount_service_account_token=config.get('automount_service_account_token', False)
+        )
     
     def _find_config_file(self) -> str:
         """Find configuration file using fallback strategy"""
-        for config_dir in self.DEFAULT_CONFIG_DIRS:
-            config_path = os.path.join(config_dir, self.DEFAULT_CONFIG_FILE)
-            if os.path.exists(config_path):
-                return config_path
-        
-        # Return first directory as default location
-        return os.path.join(self.DEFAULT_CONFIG_DIRS[0], self.DEFAULT_CONFIG_FILE)
+        return _find_config_file(tuple(self.DEFAULT_CONFIG_DIRS), self.DEFAULT_CONFIG_FILE)
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create default"""
+        # Detect namespace before loading config so it can be used as default
+        self._detected_namespace = self._detect_namespace()
+        
         if not os.path.exists(self.config_file):
             self._create_default_config()
         
+        # Stat before reading so a concurrent edit is never cached as current
         try:
-            with open(self.config_file, 'r') as f:
-                config = yaml.safe_load(f) or {}
-        except yaml.YAMLError as e:
-            raise ConfigurationError(f"Invalid YAML in config file {self.config_file}: {e}")
-        except IOError as e:
+            stat = os.stat(self.config_file)
+            source = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+        except OSError as e:
             raise ConfigurationError(f"Cannot read config file {self.config_file}: {e}")
         
-        # Merge with defaults
-        merged_config = self.DEFAULT_CONFIG.copy()
+        config = self._read_cached_config(source)
+        if config is None:
+            import yaml
+            try:
+                # libyaml parses a single in-memory buffer faster than a stream
+                with open(self.config_file, 'rb') as f:
+                    config = yaml.load(f.read(), Loader=_yaml_loader()) or {}
+            except yaml.YAMLError as e:
+                raise ConfigurationError(f"Invalid YAML in config file {self.config_file}: {e}")
+            except IOError as e:
+                raise ConfigurationError(f"Cannot read config file {self.config_file}: {e}")
+            self._write_cached_config(config, source)
+        
+        # Merge with defaults; nested defaults (security_context,
+        # node_selector) are copied so configs and job templates never share them
+        merged_config = copy.deepcopy(dict(self.DEFAULT_CONFIG))
         merged_config.update(config)
         
         # Auto-detect namespace if not set
@@ -82,40 +180,77 @@ class Config:
         
         return merged_config
     
+    @property
+    def _cache_file(self) -> str:
+        """Path of the JSON sidecar caching the parsed config file"""
+        return self.config_file + ".cache.json"
+    
+    def _read_cached_config(self, source: Dict[str, int]) -> Optional[Dict[str, Any]]:
+        """Return the cached parsed config if it was made from this exact YAML file"""
+        try:
+            with open(self._cache_file, 'r') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # Exact mtime_ns/size match: a restored older file or an edit within
+        # one coarse mtime tick must not reuse the cache
+        if not isinstance(cached, dict) or cached.get('source') != source:
+            return None
+        config = cached.get('config')
+        return config if isinstance(config, dict) else None
+    
+    def _write_cached_config(self, config: Dict[str, Any], source: Dict[str, int]) -> None:
+        """Atomically write the JSON sidecar, ignoring unwritable locations"""
+        try:
+            encoded = json.dumps({'source': source, 'config': config})
+        except (TypeError, ValueError):
+            return  # values JSON cannot represent, e.g. YAML dates
+        # JSON silently rewrites some values (non-str keys, tuples); only
+        # cache configs that load back identical
+        if json.loads(encoded)['config'] != config:
+            return
+        
+        tmp_file = self._cache_file + ".tmp"
+        try:
+            with open(tmp_file, 'w') as f:
+                f.write(encoded)
+            os.replace(tmp_file, self._cache_file)
+        except OSError:
+            # Config may live in a read-only directory
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+    
     def _create_default_config(self) -> None:
         """Create default configuration file"""
         config_dir = os.path.dirname(self.config_file)
         os.makedirs(config_dir, exist_ok=True)
         
         # Use detected namespace in default config
-        default_config = self.DEFAULT_CONFIG.copy()
-        default_config['namespace'] = self._detected_namespace
+        data = _default_config_yaml()
+        if self._detected_namespace is not None:
+            import yaml
+            namespace_line = yaml.dump(
+                {'namespace': self._detected_namespace},
+                Dumper=_yaml_dumper(), default_flow_style=False, encoding='utf-8'
+            )
+            data = data.replace(b"namespace: null\n", namespace_line, 1)
         
-        with open(self.config_file, 'w') as f:
-            yaml.dump(default_config, f, default_flow_style=False, indent=2)
+        with open(self.config_file, 'wb') as f:
+            f.write(data)
     
     def _apply_env_overrides(self, config: Dict[str, Any]) -> None:
         """Apply environment variable overrides"""
-        env_mappings = {
-            'KUBEXEC_DOCKER_IMAGE': 'docker_image',
-            'KUBEXEC_NAMESPACE': 'namespace',
-            'KUBEXEC_MEMORY': 'memory',
-            'KUBEXEC_CPU': 'cpu',
-            'KUBEXEC_WORKDIR': 'workdir',
-            'KUBEXEC_CLEANUP': 'cleanup',
-            'KUBEXEC_VERBOSE': 'verbose',
-            'KUBEXEC_TIMEOUT': 'timeout',
-        }
-        
-        for env_var, config_key in env_mappings.items():
-            env_value = os.getenv(env_var)
-            if env_value is not None:
-                if config_key in ['cleanup', 'verbose']:
-                    config[config_key] = env_value.lower() in ('true', '1', 'yes', 'on')
-                elif config_key == 'timeout':
-                    config[config_key] = int(env_value)
-                else:
-                    config[config_key] = env_value
+        for env_var in os.environ.keys() & self._ENV_MAPPINGS.keys():
+            config_key = self._ENV_MAPPINGS[env_var]
+            env_value = os.environ[env_var]
+            if config_key in self._BOOL_KEYS:
+                config[config_key] = env_value.lower() in ('true', '1', 'yes', 'on')
+            elif config_key == 'timeout':
+                config[config_key] = int(env_value)
+            else:
+                config[config_key] = env_value
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value"""
@@ -124,9 +259,17 @@ class Config:
     def update(self, updates: Dict[str, Any]) -> None:
         """Update configuration values"""
         self.config.update(updates)
+        # Rebuild the resolved snapshot on next access
+        self.__dict__.pop('resolved', None)
     
     def _detect_namespace(self) -> str:
-        """Auto-detect current namespace from service account or kubectl context"""
+        """Auto-detect current namespace, memoized for the process lifetime"""
+        if Config._cached_namespace is None:
+            Config._cached_namespace = self._lookup_namespace()
+        return Config._cached_namespace
+    
+    def _lookup_namespace(self) -> str:
+        """Look up current namespace from service account or kubectl context"""
         # Try service account namespace first (in-cluster)
         try:
             with open('/var/run/secrets/kubernetes.io/serviceaccount/namespace', 'r') as f:
@@ -136,9 +279,13 @@ class Config:
         except (FileNotFoundError, IOError):
             pass
         
-        # Try kubectl config
+        # Parse kubeconfig in-process, avoiding a kubectl subprocess
+        found, namespace = self._read_kubeconfig_namespace()
+        if found:
+            return namespace or 'default'
+        
+        # Fall back to kubectl config
         try:
-            import subprocess
             result = subprocess.run(
                 ['kubectl', 'config', 'view', '--minify', '--output', 'jsonpath={..namespace}'],
                 capture_output=True,
@@ -153,7 +300,58 @@ class Config:
         # Default fallback
         return 'default'
     
+    def _read_kubeconfig_namespace(self) -> Tuple[bool, Optional[str]]:
+        """Return (kubeconfig found, namespace of its current context)"""
+        import yaml
+        kubeconfig = os.environ.get('KUBECONFIG') or os.path.expanduser('~/.kube/config')
+        documents = []
+        for path in kubeconfig.split(os.pathsep):
+            if not path:
+                continue
+            try:
+                with open(path, 'rb') as f:
+                    documents.append(yaml.load(f.read(), Loader=_yaml_loader()) or {})
+            except OSError:
+                continue
+            except yaml.YAMLError:
+                # Let kubectl report on malformed files
+                return False, None
+        
+        if not documents:
+            return False, None
+        
+        # As with kubectl, the first file setting a value wins
+        current_context = next(
+            (doc['current-context'] for doc in documents if doc.get('current-context')), None
+        )
+        if not current_context:
+            return True, None
+        
+        for doc in documents:
+            for entry in doc.get('contexts') or []:
+                if entry.get('name') == current_context:
+                    return True, (entry.get('context') or {}).get('namespace')
+        
+        return True, None
+    
     def save(self) -> None:
         """Save current configuration to file"""
+        import yaml
         with open(self.config_file, 'w') as f:
-            yaml.dump(self.config, f, default_flow_style=False, indent=2)
\ No newline at end of file
+            yaml.dump(self.config, f, Dumper=_yaml_dumper(), default_flow_style=False, indent=2)
+        
+        # Drop the sidecar so a same-tick mtime cannot serve stale values
+        try:
+            os.remove(self._cache_file)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=1)
+def _default_config_yaml() -> bytes:
+    """Serialized Config.DEFAULT_CONFIG, dumped once per process"""
+    import yaml
+    return yaml.dump(
+        dict(Config.DEFAULT_CONFIG),
+        Dumper=_yaml_dumper(), default_flow_style=False, indent=2, encoding='utf-8'
+    )
\ No newline at end of file
@@ -1,16 +1,68 @@
 """Command and script execution logic for kubexec"""
 
 import os
+import sys
+import base64
 import logging
+import datetime
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any, Tuple
 from .k8s_client import KubernetesClient
 from .config import Config
+from .templates import create_shared_volumes, create_shared_volume_mounts
 from .utils import make_unique_name, is_script_file, parse_volume_mount, validate_resource_spec
 from .exceptions import KubeExecError, JobExecutionError
 
 
 logger = logging.getLogger(__name__)
 
+# Maximum concurrent DELETE requests when cleaning up old jobs
+CLEANUP_MAX_WORKERS = 16
+
+# Shared volume mount points, identical on the host and in job pods
+_SHARED_PREFIXES = ('/shared/team', '/shared/public')
+
+# Linux limit on a single exec argument (MAX_ARG_STRLEN); embedded scripts
+# travel inside one bash -c argument
+MAX_ARG_STRLEN = 128 * 1024
+
+
+@functools.lru_cache(maxsize=8)
+def _read_script(file_path: str, mtime_ns: int, size: int) -> str:
+    """Read script content; keyed on mtime/size so edits invalidate the cache"""
+    with open(file_path, 'r') as f:
+        return f.read()
+
+
+def _install_and_run_script(script_content: str, script_name: str) -> str:
+    """Shell snippet that writes a base64-encoded script to /tmp and runs it"""
+    encoded = base64.b64encode(script_content.encode()).decode('ascii')
+    script_path = f"/tmp/{script_name}"
+    return f"echo {encoded} | base64 -d > {script_path} && chmod +x {script_path} && {script_path}"
+
+
+def _check_command_size(command: List[str]) -> None:
+    """Reject a bash -c argument the kernel would refuse with E2BIG"""
+    # MAX_ARG_STRLEN counts the terminating NUL
+    size = len(command[-1].encode()) + 1
+    if size > MAX_ARG_STRLEN:
+        raise KubeExecError(
+            f"Command is too long to run: {size} bytes exceeds the "
+            f"{MAX_ARG_STRLEN // 1024} KiB argument limit (scripts grow by a third when embedded)"
+        )
+
+
+def _describe_script(script_content: str, script_name: str) -> str:
+    """Dry-run description of an embedded script, showing its source rather than base64"""
+    size = len(script_content.encode())
+    # base64 grows the payload by about a third
+    encoded_size = 4 * ((size + 2) // 3)
+    summary = f"run script {script_name} ({size} bytes, {encoded_size} bytes base64-encoded)"
+    if encoded_size > MAX_ARG_STRLEN:
+        summary += f" - exceeds the {MAX_ARG_STRLEN // 1024} KiB command argument limit"
+    return f"{summary}\n{script_content.rstrip()}"
+
 
 class KubeExecutor:
     """Main executor for kubexec operations"""
@@ -32,21 +84,29 @@ class KubeExecutor:
         create_pod: bool = False,
         cleanup: Optional[bool] = None,
         dry_run: bool = False,
+        stream_output: bool = False,
         **kwargs
     ) -> Tuple[int, str]:
-        """Execute target command or script"""
+        """Execute target command or script
+        
+        With stream_output, output from an existing pod is written to stdout
+        as it arrives rather than returned.
+        """
         
         # Use config defaults, override with parameters
-        image = docker_image or self.config.get('docker_image')
-        ns = namespace or self.config.get('namespace')
-        mem = validate_resource_spec(memory or self.config.get('memory'), 'memory')
-        cpu_limit = validate_resource_spec(cpu or self.config.get('cpu'), 'cpu')
-        work_dir = workdir or self.config.get('workdir')
-        should_cleanup = cleanup if cleanup is not None else self.config.get('cleanup')
+        resolved = self.config.resolved
+        image = docker_image or resolved.docker_image
+        ns = namespace or resolved.namespace
+        # Validate only the value in effect, so a CLI override can replace
+        # a bad config entry
+        mem = validate_resource_spec(memory or resolved.memory, 'memory')
+        cpu_limit = validate_resource_spec(cpu or resolved.cpu, 'cpu')
+        work_dir = workdir or resolved.workdir
+        should_cleanup = cleanup if cleanup is not None else resolved.cleanup
         
         # Determine execution strategy
         if pod_name and not create_pod and self.k8s_client.pod_exists(pod_name, ns):
-            return self._execute_in_existing_pod(target, pod_name, ns, dry_run)
+            return self._execute_in_existing_pod(target, pod_name, ns, dry_run, stream_output)
         else:
             return self._execute_in_new_job(
                 target, image, ns, mem, cpu_limit, work_dir, 
@@ -58,7 +118,8 @@ class KubeExecutor:
         target: str,
         pod_name: str,
         namespace: str,
-        dry_run: bool
+        dry_run: bool,
+        stream_output: bool = False
     ) -> Tuple[int, str]:
         """Execute command in existing pod"""
         
@@ -67,16 +128,23 @@ class KubeExecutor:
             # For script files, we need to copy the script to the pod first
             script_content = self._read_script_file(target)
             script_name = os.path.basename(target)
-            command = ["/bin/bash", "-c", f"cat << 'EOF' > /tmp/{script_name}\n{script_content}\nEOF\nchmod +x /tmp/{script_name} && /tmp/{script_name}"]
+            command = ["/bin/bash", "-c", _install_and_run_script(script_content, script_name)]
         else:
             # Direct command execution in existing pod
             command = ["/bin/bash", "-c", target]
         
         if dry_run:
+            if is_script_file(target):
+                return 0, f"Would execute in pod {pod_name}: {_describe_script(script_content, script_name)}"
             return 0, f"Would execute in pod {pod_name}: {' '.join(command)}"
         
-        logger.info(f"Executing in existing pod: {pod_name}")
-        return self.k8s_client.execute_in_existing_pod(pod_name, command, namespace)
+        _check_command_size(command)
+        
+        logger.info("Executing in existing pod: %s", pod_name)
+        return self.k8s_client.execute_in_existing_pod(
+            pod_name, command, namespace,
+            output_stream=sys.stdout if stream_output else None
+        )
     
     def _execute_in_new_job(
         self,
@@ -93,17 +161,25 @@ class KubeExecutor:
     ) -> Tuple[int, str]:
         """Execute command in new Kubernetes job"""
         
+        resolved = self.config.resolved
         job_name = make_unique_name("kubexec-job")
         
         # Prepare command and volumes
         command, volumes, volume_mount_specs = self._prepare_execution(target, job_name, namespace, volume_mounts)
         
         if dry_run:
-            return 0, f"Would create job {job_name} with image {image}: {' '.join(command)}"
+            if is_script_file(target):
+                script_content = self._read_script_file(target)
+                description = _describe_script(script_content, os.path.basename(target))
+            else:
+                description = ' '.join(command)
+            return 0, f"Would create job {job_name} with image {image}: {description}"
+        
+        _check_command_size(command)
         
         try:
             # Create job
-            logger.info(f"Creating job: {job_name}")
+            logger.info("Creating job: %s", job_name)
             self.k8s_client.create_job(
                 name=job_name,
                 image=image,
@@ -114,32 +190,32 @@ class KubeExecutor:
                 workdir=workdir,
                 volumes=volumes,
                 volume_mounts=volume_mount_specs,
-                security_context=self.config.get('security_context'),
-                ttl_seconds_after_finished=self.config.get('ttl_seconds_after_finished', 60),
-                node_selector=self.config.get('node_selector'),
-                automount_service_account_token=self.config.get('automount_service_account_token', False),
+                security_context=resolved.security_context,
+                ttl_seconds_after_finished=resolved.ttl_seconds_after_finished,
+                node_selector=resolved.node_selector,
+                automount_service_account_token=resolved.automount_service_account_token,
                 **kwargs
             )
             
             # Wait for completion
-            logger.info(f"Waiting for job completion: {job_name}")
+            logger.info("Waiting for job completion: %s", job_name)
             exit_code, logs = self.k8s_client.wait_for_job_completion(
-                job_name, namespace, timeout=self.config.get('timeout', 3600)
+                job_name, namespace, timeout=resolved.timeout
             )
             
             return exit_code, logs
             
         except Exception as e:
-            logger.error(f"Job execution failed: {e}")
+            logger.error("Job execution failed: %s", e)
             raise JobExecutionError(f"Job execution failed: {e}")
         
         finally:
             if cleanup:
                 try:
-                    logger.info(f"Cleaning up job: {job_name}")
+                    logger.info("Cleaning up job: %s", job_name)
                     self.k8s_client.cleanup_job(job_name, namespace)
                 except Exception as e:
-                    logger.warning(f"Failed to cleanup job {job_name}: {e}")
+                    logger.warning("Failed to cleanup job %s: %s", job_name, e)
     
     def _prepare_execution(
         self,
@@ -154,24 +230,15 @@ class KubeExecutor:
         volume_mount_specs = []
         
         # Add shared volumes by default
-        from .templates import create_shared_volumes, create_shared_volume_mounts
         volumes.extend(create_shared_volumes())
         volume_mount_specs.extend(create_shared_volume_mounts())
         
         # Determine kubexec entry path within shared volumes
-        import os
         current_dir = os.getcwd()
         
-        # Map current directory to container path using shared volumes
-        if current_dir.startswith('/shared/team'):
-            # Already in shared team directory
-            kubexec_entry_path = current_dir.replace('/shared/team', '/shared/team')
-        elif current_dir.startswith('/shared/public'):
-            # In shared public directory
-            kubexec_entry_path = current_dir.replace('/shared/public', '/shared/public')
-        else:
-            # Default to shared team directory
-            kubexec_entry_path = '/shared/team'
+        # Shared volumes are mounted at the same paths in the container, so
+        # a directory inside them maps to itself; default to the team share
+        kubexec_entry_path = current_dir if current_dir.startswith(_SHARED_PREFIXES) else '/shared/team'
         
         # Add custom volume mounts
         if volume_mounts:
@@ -197,10 +264,11 @@ class KubeExecutor:
             script_name = os.path.basename(target)
             
             # Embed script content directly in command instead of using ConfigMap
-            # This avoids permission issues with ConfigMap creation
+            # This avoids permission issues with ConfigMap creation; base64
+            # keeps it ASCII-only and immune to heredoc sentinel clashes
             command = [
                 "/bin/bash", "-c",
-                f"cd {kubexec_entry_path} && cat << 'KUBEXEC_SCRIPT_EOF' > /tmp/{script_name}\n{script_content}\nKUBEXEC_SCRIPT_EOF\nchmod +x /tmp/{script_name} && /tmp/{script_name}"
+                f"cd {kubexec_entry_path} && {_install_and_run_script(script_content, script_name)}"
             ]
         else:
             # Direct command execution - change to entry directory first
@@ -211,52 +279,37 @@ class KubeExecutor:
     def _read_script_file(self, file_path: str) -> str:
         """Read script file content"""
         try:
-            with open(file_path, 'r') as f:
-                return f.read()
+            stat = os.stat(file_path)
+            return _read_script(file_path, stat.st_mtime_ns, stat.st_size)
         except IOError as e:
             raise KubeExecError(f"Failed to read script file {file_path}: {e}")
     
     def list_jobs(self, namespace: str = "default") -> List[Dict[str, Any]]:
         """List kubexec jobs in namespace"""
-        try:
-            jobs = self.batch_v1.list_namespaced_job(
-                namespace=namespace,
-                label_selector="app=kubexec"
-            )
-            
-            job_list = []
-            for job in jobs.items:
-                job_info = {
-                    'name': job.metadata.name,
-                    'status': 'completed' if job.status.succeeded else 'failed' if job.status.failed else 'running',
-                    'created': job.metadata.creation_timestamp,
-                    'image': job.spec.template.spec.containers[0].image if job.spec.template.spec.containers else 'unknown'
-                }
-                job_list.append(job_info)
-            
-            return job_list
-            
-        except ApiException as e:
-            raise KubernetesClientError(f"Failed to list jobs: {e}")
+        return [
+            {
+                'name': job['name'],
+                'status': 'completed' if job['succeeded'] else 'failed' if job['failed'] else 'running',
+                'created': job['created'],
+                'image': job['image']
+            }
+            for job in self.k8s_client.list_kubexec_jobs(namespace)
+        ]
     
     def cleanup_old_jobs(self, namespace: str = "default", max_age_hours: int = 24) -> int:
         """Cleanup old kubexec jobs"""
-        try:
-            import datetime
-            cutoff_time = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=max_age_hours)
-            
-            jobs = self.batch_v1.list_namespaced_job(
-                namespace=namespace,
-                label_selector="app=kubexec"
-            )
-            
-            cleaned_count = 0
-            for job in jobs.items:
-                if job.metadata.creation_timestamp < cutoff_time:
-                    self.k8s_client.cleanup_job(job.metadata.name, namespace)
-                    cleaned_count += 1
-            
-            return cleaned_count
-            
-        except ApiException as e:
-            raise KubernetesClientError(f"Failed to cleanup old jobs: {e}")
\ No newline at end of file
+        cutoff_time = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=max_age_hours)
+        
+        old_jobs = [
+            job['name'] for job in self.k8s_client.list_kubexec_jobs(namespace)
+            if job['created'] and job['created'] < cutoff_time
+        ]
+        if not old_jobs:
+            return 0
+        
+        # The API server cannot field-select on creationTimestamp, so
+        # issue the per-job deletes concurrently over the shared client
+        with ThreadPoolExecutor(max_workers=min(CLEANUP_MAX_WORKERS, len(old_jobs))) as pool:
+            list(pool.map(lambda name: self.k8s_client.cleanup_job(name, namespace), old_jobs))
+        
+        return len(old_jobs)
\ No newline at end of file
@@ -1,9 +1,17 @@
 """Kubernetes client operations for kubexec"""
 
+import json
 import time
+import socket
 import logging
-from typing import List, Tuple, Optional, Dict, Any
-from kubernetes import client, config
+import subprocess
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Optional, Dict, Any, TextIO
+import urllib3
+from kubernetes import client, config, watch
+from kubernetes.client import api_client as _k8s_api_client, rest as _k8s_rest
 from kubernetes.client.rest import ApiException
 from .exceptions import KubernetesClientError, JobExecutionError, PodNotFoundError
 from .templates import create_job_template, create_configmap_template
@@ -11,6 +19,156 @@ from .templates import create_job_template, create_configmap_template
 
 logger = logging.getLogger(__name__)
 
+# Disable SSL verification warnings for self-signed certificates
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+
+class _OrjsonModule:
+    """Stand-in for the json module inside kubernetes.client, backed by orjson"""
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(json, name)
+    
+    @staticmethod
+    def dumps(obj: Any, **kwargs) -> str:
+        if not kwargs:
+            try:
+                encoded = orjson.dumps(obj)
+            except TypeError:
+                pass  # e.g. non-str keys or huge ints; let stdlib decide
+            else:
+                # Keep stdlib's ASCII-only output: a str body is latin-1
+                # encoded by http.client under urllib3 1.x
+                if encoded.isascii():
+                    return encoded.decode()
+        return json.dumps(obj, **kwargs)
+    
+    @staticmethod
+    def loads(data: Any, **kwargs) -> Any:
+        if kwargs:
+            return json.loads(data, **kwargs)
+        return orjson.loads(data)
+
+
+# Connections kept per host; covers concurrent cleanup deletes
+CONNECTION_POOL_MAXSIZE = 32
+
+# TCP keep-alive timing (seconds) so idle API connections survive LB/NAT timeouts
+KEEPALIVE_IDLE = 30
+KEEPALIVE_INTERVAL = 10
+KEEPALIVE_COUNT = 6
+
+# Seconds before checking a pending job's pod for image pull errors
+IMAGE_PULL_CHECK_DELAY = 30
+
+# Longest single watch request while waiting for a job (seconds)
+WATCH_WINDOW = 300
+
+# Timeout for one-shot list requests (seconds)
+API_REQUEST_TIMEOUT = 30
+
+# Maximum run time of a command executed in an existing pod (seconds)
+EXEC_TIMEOUT = 3600
+
+# How long create_job waits to learn the name of the job's pod (seconds)
+POD_DISCOVERY_TIMEOUT = 5
+
+# Decoder for raw (_preload_content=False) API responses
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def enable_orjson() -> bool:
+    """Route kubernetes.client JSON through orjson when it is installed
+    
+    This patches the kubernetes package process-wide, so it is left to
+    the kubexec command-line entry points rather than done on import.
+    Returns True if orjson is in use.
+    """
+    if orjson is None:
+        return False
+    # Request bodies are encoded in rest.py, responses decoded in api_client.py
+    if not isinstance(_k8s_rest.json, _OrjsonModule):
+        _k8s_rest.json = _OrjsonModule()
+        _k8s_api_client.json = _OrjsonModule()
+    return True
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a Kubernetes RFC 3339 timestamp into an aware datetime"""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _keepalive_socket_options() -> List[Tuple[int, int, int]]:
+    """urllib3 socket options enabling TCP keep-alive where the OS supports it"""
+    options = list(urllib3.connection.HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # TCP_KEEPIDLE is missing on macOS; TCP_KEEPINTVL/TCP_KEEPCNT on older platforms
+    for name, value in (('TCP_KEEPIDLE', KEEPALIVE_IDLE),
+                        ('TCP_KEEPINTVL', KEEPALIVE_INTERVAL),
+                        ('TCP_KEEPCNT', KEEPALIVE_COUNT)):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+def pod_summary(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the fields kubexec displays from a raw (JSON-decoded) pod"""
+    metadata = item.get('metadata') or {}
+    spec = item.get('spec') or {}
+    status = item.get('status') or {}
+    
+    restarts = 0
+    for container_status in status.get('containerStatuses') or []:
+        restarts += container_status.get('restartCount', 0)
+    
+    containers = spec.get('containers') or []
+    return {
+        'name': metadata.get('name'),
+        'phase': status.get('phase'),
+        'restarts': restarts,
+        'created': _parse_timestamp(metadata.get('creationTimestamp')),
+        'node': spec.get('nodeName'),
+        'image': containers[0].get('image') if containers else None,
+        'resource_version': metadata.get('resourceVersion')
+    }
+
+
+# Loaded client configurations keyed by context (None: auto-detected), so
+# the kubeconfig is read and parsed at most once per context per process
+_configurations: Dict[Optional[str], client.Configuration] = {}
+
+
+def _load_configuration(context: Optional[str] = None) -> client.Configuration:
+    """Return the client configuration for a context, loading it on first use"""
+    configuration = _configurations.get(context)
+    if configuration is not None:
+        return configuration
+    
+    configuration = client.Configuration()
+    if context:
+        config.load_kube_config(context=context, client_configuration=configuration)
+    else:
+        # Try in-cluster config first, then kube config
+        try:
+            config.load_incluster_config(client_configuration=configuration)
+        except config.ConfigException:
+            try:
+                config.load_kube_config(client_configuration=configuration)
+            except config.ConfigException:
+                # If no kubeconfig exists, try to use service account
+                logger.warning("No kubeconfig found, using service account authentication")
+                config.load_incluster_config(client_configuration=configuration)
+    
+    _configurations[context] = configuration
+    return configuration
+
 
 class KubernetesClient:
     """Kubernetes client wrapper for kubexec operations"""
@@ -18,43 +176,76 @@ class KubernetesClient:
     def __init__(self, context: Optional[str] = None):
         """Initialize Kubernetes client"""
         try:
-            # Disable SSL verification warnings for self-signed certificates
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            
-            if context:
-                config.load_kube_config(context=context)
-            else:
-                # Try in-cluster config first, then kube config
-                try:
-                    config.load_incluster_config()
-                except config.ConfigException:
-                    try:
-                        config.load_kube_config()
-                    except config.ConfigException:
-                        # If no kubeconfig exists, try to use service account
-                        logger.warning("No kubeconfig found, using service account authentication")
-                        config.load_incluster_config()
+            configuration = _load_configuration(context)
             
             # Configure client for potential SSL issues
-            configuration = client.Configuration.get_default_copy()
             if hasattr(configuration, 'verify_ssl'):
                 configuration.verify_ssl = False
             
-            self.batch_v1 = client.BatchV1Api(client.ApiClient(configuration))
-            self.core_v1 = client.CoreV1Api(client.ApiClient(configuration))
-            self.apps_v1 = client.AppsV1Api(client.ApiClient(configuration))
+            # Share one connection pool across all APIs so keep-alive
+            # connections are reused instead of re-handshaking per call
+            configuration.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+            self._api_client = client.ApiClient(configuration)
+            
+            # Newer kubernetes clients already set keep-alive (or honour
+            # configuration.socket_options); only fill in when absent
+            pool_kw = self._api_client.rest_client.pool_manager.connection_pool_kw
+            if 'socket_options' not in pool_kw:
+                pool_kw['socket_options'] = _keepalive_socket_options()
+            
+            self.batch_v1 = client.BatchV1Api(self._api_client)
+            self.core_v1 = client.CoreV1Api(self._api_client)
+            self.apps_v1 = client.AppsV1Api(self._api_client)
+            
+            # (namespace, job name) -> pod name
+            self._job_pods: Dict[Tuple[str, str], str] = {}
             
         except Exception as e:
             raise KubernetesClientError(f"Failed to initialize Kubernetes client: {e}")
     
+    def close(self) -> None:
+        """Release pooled connections and worker threads"""
+        self._api_client.close()
+    
+    def __enter__(self) -> 'KubernetesClient':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     def get_pods(self, namespace: str = "default") -> List[str]:
         """Get list of pod names in namespace"""
+        pods, _ = self.list_pod_summaries(namespace)
+        return [pod['name'] for pod in pods]
+    
+    def list_pod_summaries(
+        self,
+        namespace: str = "default",
+        label_selector: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """List pods as pod_summary() dicts, plus the list's resourceVersion
+        
+        The raw response is decoded directly, skipping the kubernetes
+        client's model deserialization. resource_version="0" is served from
+        the API server's watch cache instead of a quorum read from etcd.
+        """
         try:
-            pods = self.core_v1.list_namespaced_pod(namespace=namespace)
-            return [pod.metadata.name for pod in pods.items]
+            response = self.core_v1.list_namespaced_pod(
+                namespace=namespace,
+                label_selector=label_selector,
+                resource_version="0",
+                _request_timeout=API_REQUEST_TIMEOUT,
+                _preload_content=False
+            )
+            try:
+                data = _json_loads(response.data)
+            finally:
+                response.release_conn()
         except ApiException as e:
             raise KubernetesClientError(f"Failed to list pods: {e}")
+        
+        pods = [pod_summary(item) for item in data.get('items') or []]
+        return pods, (data.get('metadata') or {}).get('resourceVersion')
     
     def pod_exists(self, pod_name: str, namespace: str = "default") -> bool:
         """Check if pod exists"""
@@ -66,10 +257,17 @@ class KubernetesClient:
                 return False
             raise KubernetesClientError(f"Failed to check pod existence: {e}")
     
-    def create_configmap(self, name: str, namespace: str, script_content: str, script_name: str = "script.sh") -> str:
-        """Create ConfigMap with script content"""
+    def create_configmap(
+        self,
+        name: str,
+        namespace: str,
+        script_content: str,
+        script_name: str = "script.sh",
+        job_name: Optional[str] = None
+    ) -> str:
+        """Create ConfigMap with script content, optionally owned by a job"""
         try:
-            configmap_template = create_configmap_template(name, namespace, script_content, script_name)
+            configmap_template = create_configmap_template(name, namespace, script_content, script_name, job_name)
             self.core_v1.create_namespaced_config_map(
                 namespace=namespace,
                 body=configmap_template
@@ -101,41 +299,97 @@ class KubernetesClient:
                 body=job_template
             )
             
-            logger.info(f"Created job: {name}")
+            logger.info("Created job: %s", name)
+            self._discover_job_pod(name, namespace)
             return name
             
         except ApiException as e:
             raise KubernetesClientError(f"Failed to create job: {e}")
     
+    def list_kubexec_jobs(self, namespace: str = "default") -> List[Dict[str, Any]]:
+        """List kubexec jobs, decoding only the fields kubexec uses"""
+        try:
+            # Skip model deserialization of the full V1Job tree
+            response = self.batch_v1.list_namespaced_job(
+                namespace=namespace,
+                label_selector="app=kubexec",
+                _preload_content=False
+            )
+            try:
+                items = _json_loads(response.data).get('items') or []
+            finally:
+                response.release_conn()
+        except ApiException as e:
+            raise KubernetesClientError(f"Failed to list jobs: {e}")
+        
+        jobs = []
+        for item in items:
+            metadata = item.get('metadata') or {}
+            status = item.get('status') or {}
+            containers = (((item.get('spec') or {}).get('template') or {}).get('spec') or {}).get('containers') or []
+            jobs.append({
+                'name': metadata.get('name'),
+                'succeeded': status.get('succeeded'),
+                'failed': status.get('failed'),
+                'created': _parse_timestamp(metadata.get('creationTimestamp')),
+                'image': containers[0].get('image', 'unknown') if containers else 'unknown'
+            })
+        
+        return jobs
+    
     def wait_for_job_completion(self, job_name: str, namespace: str = "default", timeout: int = 3600) -> Tuple[int, str]:
         """Wait for job completion and return exit code and logs"""
         start_time = time.time()
+        deadline = start_time + timeout
         image_pull_check_done = False
+        job_watch = watch.Watch()
         
-        while time.time() - start_time < timeout:
+        while time.time() < deadline:
+            # Watch in bounded windows so the image pull check and the
+            # wall-clock deadline still run while the job emits no events
+            window = IMAGE_PULL_CHECK_DELAY if not image_pull_check_done else WATCH_WINDOW
+            window = max(1, int(min(window, deadline - time.time())))
+            
+            seen_event = False
             try:
-                job = self.batch_v1.read_namespaced_job(name=job_name, namespace=namespace)
-                
-                if job.status.succeeded:
-                    logs = self.get_job_logs(job_name, namespace)
-                    return 0, logs
-                elif job.status.failed:
-                    logs = self.get_job_logs(job_name, namespace)
-                    return 1, logs
-                
-                # Check for image pull issues early
-                if not image_pull_check_done and time.time() - start_time > 30:
-                    pod_status = self._check_pod_image_pull_status(job_name, namespace)
-                    if pod_status == "ImagePullBackOff":
-                        raise JobExecutionError(f"Job {job_name} failed: Cannot pull Docker image. Check image name and registry access.")
-                    elif pod_status == "ErrImagePull":
-                        raise JobExecutionError(f"Job {job_name} failed: Image pull error. Verify image exists and is accessible.")
-                    image_pull_check_done = True
-                
-                time.sleep(2)
+                for event in job_watch.stream(
+                    self.batch_v1.list_namespaced_job,
+                    namespace=namespace,
+                    field_selector=f"metadata.name={job_name}",
+                    timeout_seconds=window
+                ):
+                    seen_event = True
+                    if event['type'] == 'ERROR':
+                        # e.g. expired resource version; restart the watch
+                        break
+                    if event['type'] == 'DELETED':
+                        raise JobExecutionError(f"Job {job_name} was deleted before completion")
+                    
+                    status = event['object'].status
+                    if status.succeeded:
+                        job_watch.stop()
+                        return 0, self.get_job_logs(job_name, namespace)
+                    elif status.failed:
+                        job_watch.stop()
+                        return 1, self.get_job_logs(job_name, namespace)
                 
             except ApiException as e:
-                raise KubernetesClientError(f"Failed to check job status: {e}")
+                if e.status != 410:
+                    raise KubernetesClientError(f"Failed to check job status: {e}")
+            else:
+                # Every new watch opens with an ADDED event for an existing
+                # job, so a silent window means the job is gone
+                if not seen_event:
+                    raise JobExecutionError(f"Job {job_name} not found")
+            
+            # Check for image pull issues early
+            if not image_pull_check_done and time.time() - start_time >= IMAGE_PULL_CHECK_DELAY:
+                pod_status = self._check_pod_image_pull_status(job_name, namespace)
+                if pod_status == "ImagePullBackOff":
+                    raise JobExecutionError(f"Job {job_name} failed: Cannot pull Docker image. Check image name and registry access.")
+                elif pod_status == "ErrImagePull":
+                    raise JobExecutionError(f"Job {job_name} failed: Image pull error. Verify image exists and is accessible.")
+                image_pull_check_done = True
         
         raise JobExecutionError(f"Job {job_name} timed out after {timeout} seconds")
     
@@ -143,83 +397,175 @@ class KubernetesClient:
         """Get logs from job's pod"""
         try:
             # Find pod created by the job
-            pods = self.core_v1.list_namespaced_pod(
-                namespace=namespace,
-                label_selector=f"job-name={job_name}"
-            )
-            
-            if not pods.items:
+            pod_name = self._find_job_pod(job_name, namespace)
+            if pod_name is None:
                 return "No pod found for job"
             
-            pod_name = pods.items[0].metadata.name
-            logs = self.core_v1.read_namespaced_pod_log(
+            # The job has finished, so a plain read gets the whole log; the
+            # (connect, read) timeout bounds a stalled connection
+            return self.core_v1.read_namespaced_pod_log(
                 name=pod_name,
                 namespace=namespace,
-                container="kubexec-container"
+                container="kubexec-container",
+                _request_timeout=(API_REQUEST_TIMEOUT, API_REQUEST_TIMEOUT)
             )
-            return logs
             
         except ApiException as e:
-            logger.warning(f"Failed to get job logs: {e}")
+            logger.warning("Failed to get job logs: %s", e)
             return f"Failed to retrieve logs: {e}"
     
-    def cleanup_job(self, job_name: str, namespace: str = "default") -> None:
-        """Delete job and associated resources"""
+    def _discover_job_pod(self, job_name: str, namespace: str) -> None:
+        """Record the pod of a freshly created job from the first watch event
+        
+        Best effort: if no pod shows up within POD_DISCOVERY_TIMEOUT,
+        _find_job_pod falls back to listing pods later.
+        """
+        w = watch.Watch()
         try:
-            # Delete job (this will also delete associated pods)
-            self.batch_v1.delete_namespaced_job(
-                name=job_name,
+            for event in w.stream(
+                self.core_v1.list_namespaced_pod,
                 namespace=namespace,
-                body=client.V1DeleteOptions(
-                    propagation_policy="Foreground"
-                )
+                label_selector=f"job-name={job_name}",
+                timeout_seconds=POD_DISCOVERY_TIMEOUT,
+                _request_timeout=POD_DISCOVERY_TIMEOUT + 5
+            ):
+                if event['type'] in ('ADDED', 'MODIFIED'):
+                    self._job_pods[(namespace, job_name)] = event['raw_object']['metadata']['name']
+                    break
+        except Exception as e:
+            logger.debug("Pod discovery for job %s failed: %s", job_name, e)
+        finally:
+            w.stop()
+    
+    def _find_job_pod(self, job_name: str, namespace: str) -> Optional[str]:
+        """Return the name of the pod created by a job, caching the lookup"""
+        key = (namespace, job_name)
+        pod_name = self._job_pods.get(key)
+        if pod_name is None:
+            response = self.core_v1.list_namespaced_pod(
+                namespace=namespace,
+                label_selector=f"job-name={job_name}",
+                limit=1,
+                resource_version="0",
+                _request_timeout=API_REQUEST_TIMEOUT,
+                _preload_content=False
             )
-            
-            # Delete ConfigMap if it exists
             try:
-                self.core_v1.delete_namespaced_config_map(
-                    name=f"{job_name}-script",
-                    namespace=namespace
+                items = _json_loads(response.data).get('items')
+            finally:
+                response.release_conn()
+            if not items:
+                return None
+            pod_name = self._job_pods[key] = items[0]['metadata']['name']
+        return pod_name
+    
+    def cleanup_job(self, job_name: str, namespace: str = "default") -> None:
+        """Delete job and associated resources"""
+        try:
+            # Delete the script ConfigMap on a side thread so the two DELETEs
+            # overlap; a dedicated thread avoids the ApiClient's one-thread pool
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                configmap = pool.submit(self._delete_job_configmap, job_name, namespace)
+                
+                # Delete job (this will also delete associated pods)
+                self.batch_v1.delete_namespaced_job(
+                    name=job_name,
+                    namespace=namespace,
+                    body=client.V1DeleteOptions(
+                        propagation_policy="Foreground"
+                    )
                 )
-            except ApiException:
-                pass  # ConfigMap might not exist
+                configmap.result()
             
-            logger.info(f"Cleaned up job: {job_name}")
+            self._job_pods.pop((namespace, job_name), None)
+            logger.info("Cleaned up job: %s", job_name)
             
         except ApiException as e:
             raise KubernetesClientError(f"Failed to cleanup job: {e}")
     
+    def _delete_job_configmap(self, job_name: str, namespace: str) -> None:
+        """Delete the job's <job>-script ConfigMap, if there is one"""
+        try:
+            self.core_v1.delete_namespaced_config_map(
+                name=f"{job_name}-script",
+                namespace=namespace
+            )
+        except ApiException as e:
+            if e.status == 404:
+                return  # ConfigMap might not exist
+            if e.status == 403:
+                # No ConfigMap access in restricted namespaces is expected
+                logger.debug("No permission to delete ConfigMap for job %s", job_name)
+                return
+            logger.warning("Failed to delete ConfigMap for job %s: %s", job_name, e)
+    
     def execute_in_existing_pod(
         self,
         pod_name: str,
         command: List[str],
         namespace: str = "default",
-        container: Optional[str] = None
+        container: Optional[str] = None,
+        output_stream: Optional[TextIO] = None
     ) -> Tuple[int, str]:
-        """Execute command in existing pod"""
+        """Execute command in existing pod
+        
+        Output is read incrementally. If output_stream is given, lines are
+        forwarded to it as they arrive instead of being collected and returned.
+        """
         try:
-            if not self.pod_exists(pod_name, namespace):
-                raise PodNotFoundError(f"Pod {pod_name} not found in namespace {namespace}")
-            
+            # No existence pre-check: kubectl exec looks the pod up itself
+            # and reports a missing pod, which is mapped to PodNotFoundError
             # Use kubectl exec through subprocess as kubernetes client doesn't support exec well
-            import subprocess
-            
             kubectl_cmd = ["kubectl", "exec", "-n", namespace, pod_name]
             if container:
                 kubectl_cmd.extend(["-c", container])
             kubectl_cmd.extend(["--"] + command)
             
-            result = subprocess.run(
+            process = subprocess.Popen(
                 kubectl_cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=3600
+                bufsize=1
             )
             
-            return result.returncode, result.stdout + result.stderr
+            timed_out = threading.Event()
+            
+            def _kill() -> None:
+                timed_out.set()
+                process.kill()
+            
+            timer = threading.Timer(EXEC_TIMEOUT, _kill)
+            timer.start()
+            output = []
+            not_found_message = f'pods "{pod_name}" not found'
+            pod_not_found = False
+            try:
+                for line in process.stdout:
+                    if not_found_message in line and line.startswith("Error from server (NotFound)"):
+                        pod_not_found = True
+                    if output_stream is not None:
+                        output_stream.write(line)
+                        output_stream.flush()
+                    else:
+                        output.append(line)
+                process.wait()
+            finally:
+                timer.cancel()
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                process.stdout.close()
+            
+            if timed_out.is_set():
+                raise JobExecutionError("Command execution timed out")
+            if process.returncode != 0 and pod_not_found:
+                raise PodNotFoundError(f"Pod {pod_name} not found in namespace {namespace}")
+            
+            return process.returncode, "".join(output)
             
-        except subprocess.TimeoutExpired:
-            raise JobExecutionError("Command execution timed out")
+        except (JobExecutionError, PodNotFoundError):
+            raise
         except Exception as e:
             raise KubernetesClientError(f"Failed to execute in pod: {e}")
     
@@ -228,7 +574,10 @@ class KubernetesClient:
         try:
             pods = self.core_v1.list_namespaced_pod(
                 namespace=namespace,
-                label_selector=f"job-name={job_name}"
+                label_selector=f"job-name={job_name}",
+                limit=1,
+                resource_version="0",
+                _request_timeout=API_REQUEST_TIMEOUT
             )
             
             if not pods.items:
@@ -245,5 +594,5 @@ class KubernetesClient:
             return None
             
         except ApiException as e:
-            logger.warning(f"Failed to check pod image pull status: {e}")
+            logger.warning("Failed to check pod image pull status: %s", e)
             return None
\ No newline at end of file
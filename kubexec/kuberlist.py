@@ -3,17 +3,29 @@
 import argparse
 import logging
 import sys
-from datetime import datetime, timezone
-from typing import Optional
-from rich.console import Console
+import time
+from typing import Any, Dict, List, Optional
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+from rich.console import Console, Group
+from rich.live import Live
 from rich.table import Table
 from rich.text import Text
 from rich import box
 from .config import Config
-from .k8s_client import KubernetesClient
+from .k8s_client import KubernetesClient, enable_orjson, pod_summary
 from .exceptions import KubeExecError
 
 console = Console()
+logger = logging.getLogger(__name__)
+
+# Pod phase colors; Running depends on restarts and is handled separately
+_STATUS_COLORS = {
+    "Pending": "yellow",
+    "Succeeded": "blue",
+    "Failed": "red",
+    "Error": "red"
+}
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -27,6 +39,8 @@ def setup_logging(verbose: bool = False) -> None:
 
 def create_parser() -> argparse.ArgumentParser:
     """Create command-line argument parser"""
+    from ._version import __version__
+    
     parser = argparse.ArgumentParser(
         prog='kuberlist',
         description='List Kubernetes pods in current namespace',
@@ -84,23 +98,24 @@ Examples:
     parser.add_argument(
         '--version',
         action='version',
-        version=f'%(prog)s {__import__("kubexec").__version__}'
+        version=f'%(prog)s {__version__}'
     )
     
     return parser
 
 
-def format_age(created_time) -> str:
+def format_age(created_time, now_ts: Optional[float] = None) -> str:
     """Format pod age in human readable format"""
     if not created_time:
         return "unknown"
     
-    now = datetime.now(timezone.utc)
-    age = now - created_time
+    if now_ts is None:
+        now_ts = time.time()
     
-    days = age.days
-    hours, remainder = divmod(age.seconds, 3600)
-    minutes, _ = divmod(remainder, 60)
+    # Integer epoch arithmetic avoids a timedelta per pod
+    days, remainder = divmod(int(now_ts - created_time.timestamp()), 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes = remainder // 60
     
     if days > 0:
         return f"{days}d{hours}h"
@@ -114,14 +129,68 @@ def get_status_color(status: str, restart_count: int = 0) -> str:
     """Get color for pod status"""
     if status == "Running":
         return "green" if restart_count == 0 else "yellow"
-    elif status == "Pending":
-        return "yellow"
-    elif status == "Succeeded":
-        return "blue"
-    elif status in ["Failed", "Error"]:
-        return "red"
-    else:
-        return "white"
+    return _STATUS_COLORS.get(status, "white")
+
+
+def build_pod_table(pods: List[Dict[str, Any]], namespace: str, show_all: bool = False) -> Table:
+    """Build the Rich table for a list of pod summaries"""
+    table = Table(title=f"Pods in namespace: [bold cyan]{namespace}[/bold cyan]", box=box.ROUNDED)
+    
+    # Add columns
+    table.add_column("NAME", style="bold", no_wrap=True)
+    table.add_column("STATUS", justify="center")
+    table.add_column("RESTARTS", justify="center")
+    table.add_column("AGE", justify="center")
+    
+    if show_all:
+        table.add_column("NODE", style="dim")
+        table.add_column("IMAGE", style="dim", max_width=30)
+    
+    # Add rows; "now" is shared by every row
+    now_ts = time.time()
+    for pod in pods:
+        name = pod['name']
+        status = pod['phase']
+        restart_count = pod['restarts']
+        
+        # Format age
+        age = format_age(pod['created'], now_ts)
+        
+        # Color status based on state; markup strings are cheaper per
+        # cell than Text objects
+        status_text = f"[{get_status_color(status, restart_count)}]{status}[/]"
+        
+        # Color restart count (red if > 0)
+        restart_text = f"[red]{restart_count}[/]" if restart_count > 0 else f"[green]{restart_count}[/]"
+        
+        if show_all:
+            node = pod['node'] or "pending"
+            
+            # Get first container image
+            image = pod['image'] or "unknown"
+            if pod['image']:
+                # Shorten long image names to their last two path components
+                if len(image) > 30:
+                    repo, sep, tail = image.rpartition('/')
+                    image = f"{repo.rpartition('/')[2]}/{tail}" if sep else image[:30] + "..."
+            
+            table.add_row(
+                name,
+                status_text,
+                restart_text,
+                age,
+                node,
+                image
+            )
+        else:
+            table.add_row(
+                name,
+                status_text,
+                restart_text,
+                age
+            )
+    
+    return table
 
 
 def list_pods(
@@ -138,12 +207,9 @@ def list_pods(
         if kubexec_only:
             label_selector = "app=kubexec"
         
-        pods = k8s_client.core_v1.list_namespaced_pod(
-            namespace=namespace,
-            label_selector=label_selector
-        )
+        pods, _ = k8s_client.list_pod_summaries(namespace, label_selector)
         
-        if not pods.items:
+        if not pods:
             filter_desc = ""
             if kubexec_only:
                 filter_desc = " kubexec"
@@ -154,101 +220,76 @@ def list_pods(
         
         # Filter running pods if requested
         if running_only:
-            pods.items = [pod for pod in pods.items if pod.status.phase == "Running"]
-        
-        # Create Rich table
-        table = Table(title=f"Pods in namespace: [bold cyan]{namespace}[/bold cyan]", box=box.ROUNDED)
-        
-        # Add columns
-        table.add_column("NAME", style="bold", no_wrap=True)
-        table.add_column("STATUS", justify="center")
-        table.add_column("RESTARTS", justify="center")
-        table.add_column("AGE", justify="center")
+            pods = [pod for pod in pods if pod['phase'] == "Running"]
         
-        if show_all:
-            table.add_column("NODE", style="dim")
-            table.add_column("IMAGE", style="dim", max_width=30)
-        
-        # Add rows
-        for pod in pods.items:
-            name = pod.metadata.name
-            status = pod.status.phase
-            
-            # Get restart count
-            restart_count = 0
-            if pod.status.container_statuses:
-                restart_count = sum(cs.restart_count for cs in pod.status.container_statuses)
-            
-            # Format age
-            age = format_age(pod.metadata.creation_timestamp)
-            
-            # Color status based on state
-            status_color = get_status_color(status, restart_count)
-            status_text = Text(status, style=status_color)
-            
-            # Color restart count (red if > 0)
-            restart_style = "red" if restart_count > 0 else "green"
-            
-            if show_all:
-                node = pod.spec.node_name or "pending"
-                
-                # Get first container image
-                image = "unknown"
-                if pod.spec.containers:
-                    image = pod.spec.containers[0].image
-                    # Shorten long image names
-                    if len(image) > 30:
-                        parts = image.split('/')
-                        image = '/'.join(parts[-2:]) if len(parts) > 1 else image[:30] + "..."
-                
-                table.add_row(
-                    name,
-                    status_text,
-                    Text(str(restart_count), style=restart_style),
-                    age,
-                    node,
-                    image
-                )
-            else:
-                table.add_row(
-                    name,
-                    status_text,
-                    Text(str(restart_count), style=restart_style),
-                    age
-                )
-        
-        console.print(table)
+        console.print(build_pod_table(pods, namespace, show_all))
                 
     except Exception as e:
         raise KubeExecError(f"Failed to list pods: {e}")
 
 
+def _render_watch(pods: Dict[str, Any], namespace: str) -> Group:
+    """Render the watch view: timestamp header plus pod table"""
+    timestamp = time.strftime('%H:%M:%S', time.localtime())
+    return Group(
+        Text(f"Last updated: {timestamp}", style="dim"),
+        Text(),
+        build_pod_table([pods[name] for name in sorted(pods)], namespace, show_all=True)
+    )
+
+
 def watch_pods(
     k8s_client: KubernetesClient,
     namespace: str,
     kubexec_only: bool = False
 ) -> None:
     """Watch pod status changes"""
-    import time
+    label_selector = "app=kubexec" if kubexec_only else None
     
     console.print(f"[bold blue]Watching pods in namespace '{namespace}'[/bold blue] (press Ctrl+C to stop)")
     console.print()
     
+    pods: Dict[str, Any] = {}
+    resource_version = None
+    pod_watch = watch.Watch()
+    
     try:
-        while True:
-            # Clear screen
-            console.clear()
-            
-            # Show timestamp
-            timestamp = datetime.now().strftime('%H:%M:%S')
-            console.print(f"[dim]Last updated: {timestamp}[/dim]")
-            console.print()
-            
-            list_pods(k8s_client, namespace, show_all=True, kubexec_only=kubexec_only)
-            
-            time.sleep(5)
+        with Live(console=console, refresh_per_second=4) as live:
+            while True:
+                if resource_version is None:
+                    # (Re)list to seed the view and the watch's resume point
+                    pod_list, resource_version = k8s_client.list_pod_summaries(namespace, label_selector)
+                    pods = {pod['name']: pod for pod in pod_list}
+                    live.update(_render_watch(pods, namespace))
+                
+                try:
+                    for event in pod_watch.stream(
+                        k8s_client.core_v1.list_namespaced_pod,
+                        namespace=namespace,
+                        label_selector=label_selector,
+                        resource_version=resource_version
+                    ):
+                        if event['type'] == 'ERROR':
+                            # Resource version too old; relist
+                            resource_version = None
+                            break
+                        
+                        # Summarize the raw event object like list_pod_summaries
+                        pod = pod_summary(event['raw_object'])
+                        if event['type'] == 'DELETED':
+                            pods.pop(pod['name'], None)
+                        else:
+                            pods[pod['name']] = pod
+                        resource_version = pod['resource_version']
+                        live.update(_render_watch(pods, namespace))
+                
+                except ApiException as e:
+                    if e.status != 410:
+                        raise KubeExecError(f"Failed to watch pods: {e}")
+                    resource_version = None
             
     except KeyboardInterrupt:
+        pod_watch.stop()
         console.print("\n[yellow]Watch stopped.[/yellow]")
 
 
@@ -266,6 +307,7 @@ def main() -> int:
         namespace = args.namespace or config.get('namespace')
         
         # Initialize Kubernetes client
+        enable_orjson()
         k8s_client = KubernetesClient(args.context)
         
         if args.watch:
@@ -276,13 +318,13 @@ def main() -> int:
         return 0
         
     except KubeExecError as e:
-        logging.error(f"kuberlist error: {e}")
+        logger.error("kuberlist error: %s", e)
         return 1
     except KeyboardInterrupt:
-        logging.info("Interrupted by user")
+        logger.info("Interrupted by user")
         return 130
     except Exception as e:
-        logging.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         if args.verbose:
             import traceback
             traceback.print_exc()
@@ -75,7 +75,8 @@ def create_job_template(
             'namespace': namespace,
             'labels': {
                 'app': 'kubexec',
-                'created-by': 'kubexec'
+                'created-by': 'kubexec',
+                'kubexec-instance': name
             }
         },
         'spec': {
@@ -100,9 +101,13 @@ def create_configmap_template(
     name: str,
     namespace: str,
     script_content: str,
-    script_name: str = "script.sh"
+    script_name: str = "script.sh",
+    job_name: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Create a ConfigMap template for script storage"""
+    """Create a ConfigMap template for script storage
+    
+    ``job_name`` is the owning job, recorded in the kubexec-instance label.
+    """
     
     return {
         'apiVersion': 'v1',
@@ -112,7 +117,8 @@ def create_configmap_template(
             'namespace': namespace,
             'labels': {
                 'app': 'kubexec',
-                'created-by': 'kubexec'
+                'created-by': 'kubexec',
+                'kubexec-instance': job_name or name
             }
         },
         'data': {
@@ -1,16 +1,18 @@
 """Utility functions for kubexec"""
 
 import os
-import random
-import string
+import secrets
 import time
 from typing import Tuple
 
+# File extensions treated as scripts regardless of the executable bit
+_SCRIPT_EXTS = ('.sh', '.py', '.pl', '.R', '.rb', '.js')
+
 
 def make_unique_name(base_name: str = "kubexec") -> str:
     """Generate a unique name for pods/jobs with collision avoidance"""
     timestamp = int(time.time())
-    random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
+    random_suffix = secrets.token_hex(3)
     return f"{base_name}-{timestamp}-{random_suffix}"
 
 
@@ -21,17 +23,18 @@ def make_unique_filename(filename: str, ext: str = "") -> str:
         ext = os.path.splitext(filename)[1]
     
     timestamp = int(time.time())
-    random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=4))
+    random_suffix = secrets.token_hex(2)
     return f"{base}-{timestamp}-{random_suffix}{ext}"
 
 
 def is_script_file(target: str) -> bool:
     """Detect if target is a script file vs command string"""
-    return (
-        os.path.exists(target) and 
-        (target.endswith(('.sh', '.py', '.pl', '.R', '.rb', '.js')) or 
-         os.access(target, os.X_OK))
-    )
+    if not os.path.exists(target):
+        return False
+    # Known script extensions need no executable-bit check
+    if target.endswith(_SCRIPT_EXTS):
+        return True
+    return os.access(target, os.X_OK)
 
 
 def parse_volume_mount(volume_spec: str) -> Tuple[str, str, bool]:
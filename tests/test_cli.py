@@ -0,0 +1,75 @@
+"""Tests for kubexec command-line argument handling"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from kubexec import cli
+
+
+class SniffOperationTests(unittest.TestCase):
+    """Fast-path detection in _sniff_operation"""
+    
+    def test_version(self):
+        self.assertEqual(cli._sniff_operation(['--version']), 'version')
+    
+    def test_list_jobs(self):
+        self.assertEqual(cli._sniff_operation(['--list-jobs', '-n', 'ns']), 'operation')
+    
+    def test_cleanup_old_zero(self):
+        self.assertEqual(cli._sniff_operation(['--cleanup-old', '0']), 'operation')
+        self.assertEqual(cli._sniff_operation(['--cleanup-old=0']), 'operation')
+    
+    def test_help_uses_full_parser(self):
+        self.assertIsNone(cli._sniff_operation(['-h']))
+        self.assertIsNone(cli._sniff_operation(['--list-jobs', '--help']))
+    
+    def test_stops_at_double_dash(self):
+        self.assertIsNone(cli._sniff_operation(['pod', '--', '--list-jobs']))
+
+
+class MainOperationTests(unittest.TestCase):
+    """main() dispatch of --version, --list-jobs and --cleanup-old"""
+    
+    def run_main(self, *argv):
+        with mock.patch('sys.argv', ['kubexec', *argv]), \
+                mock.patch('kubexec.config.Config') as config_cls, \
+                mock.patch('kubexec.k8s_client.KubernetesClient'), \
+                mock.patch('kubexec.cli.setup_logging'):
+            config_cls.return_value.get.return_value = 'default'
+            return cli.main()
+    
+    def test_version(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(self.run_main('--version'), 0)
+        self.assertTrue(out.getvalue().startswith('kubexec '))
+    
+    def test_list_jobs(self):
+        with mock.patch('kubexec.cli._handle_list_jobs', return_value=0) as handler:
+            self.assertEqual(self.run_main('--list-jobs', '-n', 'ns'), 0)
+        self.assertEqual(handler.call_args.args[2], 'ns')
+    
+    def test_cleanup_old_zero(self):
+        with mock.patch('kubexec.cli._handle_cleanup_old', return_value=0) as handler:
+            self.assertEqual(self.run_main('--cleanup-old', '0'), 0)
+        self.assertEqual(handler.call_args.args[3], 0)
+    
+    def test_cleanup_old_negative(self):
+        with mock.patch('sys.stderr', io.StringIO()):
+            with self.assertRaises(SystemExit) as cm:
+                self.run_main('--cleanup-old', '-1')
+        self.assertEqual(cm.exception.code, 2)
+    
+    def test_help(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            with self.assertRaises(SystemExit) as cm:
+                self.run_main('-h')
+        self.assertEqual(cm.exception.code, 0)
+        self.assertIn('TARGET', out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file